@@ -4,35 +4,56 @@ A Streamlit-based application for AI-powered brand identity generation
 """
 
 import streamlit as st
-import json
+import streamlit.components.v1 as components
 import os
 from datetime import datetime
 from pathlib import Path
 import base64
 from io import BytesIO
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 import re
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
 
 # Third-party imports
 from passlib.hash import bcrypt
 from dotenv import load_dotenv
+import orjson
+from jsonschema import Draft202012Validator, ValidationError
 import requests
-from PIL import Image
-from fpdf import FPDF
-from textblob import TextBlob
-from langdetect import detect
+import httpx
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from langdetect import detect, DetectorFactory
+from groq import Groq, AsyncGroq
+
+# Local modules
+from brand_cache import SemanticCache
+import db
 
 # Load environment variables
 load_dotenv()
 
+# Deterministic language detection
+DetectorFactory.seed = 0
+
+logger = logging.getLogger(__name__)
+
 # ==================== CONFIGURATION ====================
 GROQ_API_KEY = os.getenv("GROQ_API_KEY")
 HF_API_TOKEN = os.getenv("HF_API_TOKEN")
 STABILITY_API_KEY = os.getenv("STABILITY_API_KEY")
 
+# Password hashing
+BCRYPT_ROUNDS = 12
+
 # File paths
 USERS_FILE = "users.json"
-PROJECTS_FILE = "projects.json"
+DB_FILE = "brandforge.db"
 
 # Supported languages
 LANGUAGES = {
@@ -55,6 +76,13 @@ COLOR_PALETTE_STYLES = {
     "Vibrant": "bright, energetic, attention-grabbing colors",
     "Neutral": "balanced, professional neutral tones"
 }
+PALETTE_STYLE_IDX = {style: i for i, style in enumerate(COLOR_PALETTE_STYLES)}
+
+# Minimum RGB distance between palette colors
+PALETTE_MIN_DISTANCE = 20
+
+# Palette editor: "component" (one batched picker) or "legacy" (one st.color_picker per color)
+PALETTE_PICKER = os.getenv("PALETTE_PICKER", "component")
 
 # Font categories
 FONT_CATEGORIES = {
@@ -62,23 +90,171 @@ FONT_CATEGORIES = {
     "Heading Fonts": ["Poppins", "Roboto", "Open Sans", "Lato", "Merriweather"],
     "Body Fonts": ["Inter", "Source Sans Pro", "Nunito", "Work Sans", "Karla"]
 }
+LOGO_FONTS = FONT_CATEGORIES["Logo Fonts"]
+HEADING_FONTS = FONT_CATEGORIES["Heading Fonts"]
+BODY_FONTS = FONT_CATEGORIES["Body Fonts"]
+
+# Font pairings by industry keyword
+INDUSTRY_FONT_PAIRINGS = {
+    "Technology": {"logo": "Montserrat", "heading": "Poppins", "body": "Inter"},
+    "Fashion": {"logo": "Playfair Display", "heading": "Lato", "body": "Source Sans Pro"},
+    "Food": {"logo": "Bebas Neue", "heading": "Open Sans", "body": "Nunito"},
+    "Health": {"logo": "Raleway", "heading": "Roboto", "body": "Work Sans"},
+    "Finance": {"logo": "Oswald", "heading": "Merriweather", "body": "Karla"},
+}
+DEFAULT_FONT_PAIRING = {"logo": "Montserrat", "heading": "Poppins", "body": "Inter"}
+
+# Logo prompt vocabulary
+LOGO_SENTIMENT_MOODS = {
+    "Positive": "energetic, vibrant, uplifting",
+    "Neutral": "balanced, professional, clean",
+    "Negative": "serious, bold, impactful"
+}
+LOGO_TYPE_DESCRIPTIONS = {
+    "Lettermark": "lettermark logo using initials of {brand_name}",
+    "Wordmark": "wordmark logo with stylized text '{brand_name}'",
+    "Symbol-based": "abstract symbol logo representing {brand_name} concept",
+    "Combination Mark": "combination logo with both symbol and text '{brand_name}'"
+}
+
+# Stable Diffusion XL: "api" (HuggingFace Inference API) or "local" (diffusers on this machine)
+SDXL_BACKEND = os.getenv("SDXL_BACKEND", "api")
+SDXL_MODEL_ID = "stabilityai/stable-diffusion-xl-base-1.0"
+SDXL_API_URL = f"https://api-inference.huggingface.co/models/{SDXL_MODEL_ID}"
+SDXL_MAX_RETRIES = 5
+SDXL_RETRY_STATUSES = [429, 503]
+SDXL_STEPS = 30
+SDXL_GUIDANCE_SCALE = 7.5
+SDXL_SIZE = 1024
+SDXL_COMPILE = os.getenv("SDXL_COMPILE") == "1"
+SDXL_QUANTIZE = os.getenv("SDXL_QUANTIZE") == "1"
+# Logo PNGs are ~1-2MB each; random-seed variations rarely repeat, so keep the cache small
+SDXL_CACHE_ENTRIES = 16
+LOGO_VARIATION_COUNT = 4
+
+# Noto TTFs for the PDF export, as <family>-Regular.ttf and <family>-Bold.ttf;
+# Helvetica has no Indic glyphs and is only the fallback when a file is missing
+PDF_FONT_DIR = os.getenv("PDF_FONT_DIR", "fonts")
+PDF_FONT_FAMILIES = {
+    "hi": "NotoSansDevanagari",
+    "te": "NotoSansTelugu",
+    "ta": "NotoSansTamil"
+}
+PDF_DEFAULT_FONT_FAMILY = "NotoSans"
+
+# PNG file signature
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
 
 # Logo types
 LOGO_TYPES = ["Lettermark", "Wordmark", "Symbol-based", "Combination Mark"]
 
+# Groq model
+GROQ_MODEL = "llama-3.3-70b-versatile"
+
+# Shared system message; keep it free of per-call values so the prompt prefix stays cacheable
+SYSTEM_PREFIX = "You are a creative branding expert."
+
+# Labeled response sections
+STORY_SECTIONS = ["VISION", "MISSION", "PROBLEM", "SOLUTION", "POSITIONING"]
+MARKETING_SECTIONS = ["SHORT_DESCRIPTION", "LONG_DESCRIPTION", "SOCIAL_CAPTION", "AD_COPY", "EMAIL_COPY"]
+
+# Groq Batch API
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_TIMEOUT_SECONDS = 600
+
 # ==================== UTILITY FUNCTIONS ====================
 
 def load_json_file(filepath: str) -> Dict:
     """Load JSON file or return empty dict if not exists"""
     if os.path.exists(filepath):
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(filepath, 'rb') as f:
+            raw = f.read()
+        # Skip '#' comment header lines in the seeded data files
+        payload = b"\n".join(line for line in raw.splitlines() if not line.lstrip().startswith(b"#"))
+        return orjson.loads(payload) if payload.strip() else {}
     return {}
 
 def save_json_file(filepath: str, data: Dict):
-    """Save data to JSON file"""
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    """Save data to JSON file atomically"""
+    tmp_path = filepath + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    os.replace(tmp_path, filepath)
+
+@st.cache_resource(show_spinner=False)
+def _users_store() -> Dict:
+    """Parsed user database shared across sessions, guarded by a write lock"""
+    return {"data": load_json_file(USERS_FILE), "lock": threading.Lock()}
+
+@st.cache_resource(show_spinner=False)
+def _project_db():
+    """SQLite project store shared across sessions"""
+    return db.connect(DB_FILE)
+
+def once(flag: str):
+    """Decorator that lets one call guarded by a session flag run at a time.
+
+    A duplicate click arrives as a new run while the first call is still in flight;
+    it waits for that call and, when it was the same function with the same
+    arguments, returns its result (or re-raises its error) instead of starting a
+    second request. Otherwise, or if the first run was stopped before finishing,
+    the waiting run makes its own call once the flag clears.
+    """
+    result_key = f"{flag}_result"
+    waiting_key = f"{flag}_waiting"
+
+    def decorator(fn):
+        def hand_over(call, ok, value):
+            # Only kept for a waiting run, so sessions do not hold on to results
+            if st.session_state.get(waiting_key):
+                st.session_state[result_key] = (call, ok, value)
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            call = (fn.__qualname__, args, kwargs)
+
+            if st.session_state.get(flag):
+                notice = st.info("Already generating, waiting for the previous request...")
+                st.session_state[waiting_key] = True
+                try:
+                    while st.session_state.get(flag):
+                        time.sleep(0.25)
+                finally:
+                    st.session_state[waiting_key] = False
+                notice.empty()
+
+                outcome = st.session_state.pop(result_key, None)
+                if outcome is not None and outcome[0] == call:
+                    _, ok, value = outcome
+                    if ok:
+                        return value
+                    raise value
+
+            st.session_state[flag] = True
+            st.session_state.pop(result_key, None)
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                hand_over(call, False, e)
+                raise
+            else:
+                hand_over(call, True, result)
+                return result
+            finally:
+                st.session_state[flag] = False
+        return wrapper
+    return decorator
+
+def lang_params(language: str, action: str) -> Tuple[str, str]:
+    """Return (language code, prompt instruction) for a UI language"""
+    lang_code = LANGUAGES.get(language, "en")
+    lang_instruction = f"{action} in {language} language." if language != "English" else ""
+    return lang_code, lang_instruction
+
+@st.cache_data(max_entries=1024, show_spinner=False)
+def cached_detect(text: str) -> str:
+    """Detect the language code of text, memoized across reruns"""
+    return detect(text)
 
 def init_session_state():
     """Initialize session state variables"""
@@ -102,36 +278,56 @@ def init_session_state():
         st.session_state.selected_palette_style = "Pastel"
     if 'logo_customization_mode' not in st.session_state:
         st.session_state.logo_customization_mode = False
+    if 'logo_variants' not in st.session_state:
+        st.session_state.logo_variants = []
+    if 'prefetch' not in st.session_state:
+        st.session_state.prefetch = {}
+    if 'marketing_job' not in st.session_state:
+        st.session_state.marketing_job = None
 
 # ==================== AUTHENTICATION ====================
 
+_bcrypt = bcrypt.using(rounds=BCRYPT_ROUNDS)
+
+@st.cache_resource(show_spinner=False)
+def _auth_pool() -> ThreadPoolExecutor:
+    """Bounded worker pool for bcrypt so concurrent logins don't serialize"""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="brandforge-auth")
+
 def hash_password(password: str) -> str:
     """Hash password using bcrypt"""
-    return bcrypt.hash(password)
+    return _auth_pool().submit(_bcrypt.hash, password).result()
 
 def verify_password(password: str, hashed: str) -> bool:
     """Verify password against hash"""
-    return bcrypt.verify(password, hashed)
+    return _auth_pool().submit(_bcrypt.verify, password, hashed).result()
 
 def signup_user(email: str, password: str) -> Tuple[bool, str]:
     """Register new user"""
-    users = load_json_file(USERS_FILE)
+    store = _users_store()
     
-    if email in users:
+    if email in store["data"]:
         return False, "Email already registered. Please login."
     
-    users[email] = {
-        "password": hash_password(password),
-        "created_at": datetime.now().isoformat(),
-        "projects": []
-    }
+    hashed = hash_password(password)
+    
+    with store["lock"]:
+        users = store["data"]
+        if email in users:
+            return False, "Email already registered. Please login."
+        
+        users[email] = {
+            "password": hashed,
+            "created_at": datetime.now().isoformat()
+        }
+        
+        save_json_file(USERS_FILE, users)
     
-    save_json_file(USERS_FILE, users)
     return True, "Signup successful! Please login."
 
 def login_user(email: str, password: str) -> Tuple[bool, str]:
     """Authenticate user"""
-    users = load_json_file(USERS_FILE)
+    users = _users_store()["data"]
     
     if email not in users:
         return False, "Account not found. Please signup first."
@@ -150,43 +346,187 @@ def logout_user():
     st.session_state.current_project = None
     st.session_state.brand_data = {}
     st.session_state.chat_history = []
+    st.session_state.logo_variants = []
+    st.session_state.prefetch = {}
+    st.session_state.marketing_job = None
+
+# ==================== SEMANTIC CACHE ====================
+
+@st.cache_resource(show_spinner=False)
+def _semantic_cache() -> SemanticCache:
+    """Semantic cache shared across sessions, persisted next to the project database"""
+    return SemanticCache(os.path.dirname(os.path.abspath(DB_FILE)))
+
+def semantic_cache_lookup(namespace: str, text: str) -> Optional[str]:
+    """Return a cached response for a near-duplicate input, if any"""
+    try:
+        return _semantic_cache().lookup(namespace, text)
+    except Exception:
+        logger.exception("Semantic cache lookup failed")
+        return None
+
+def semantic_cache_store(namespace: str, text: str, response: str):
+    """Add a response to the semantic cache and persist it"""
+    try:
+        _semantic_cache().store(namespace, text, response)
+    except Exception:
+        logger.exception("Semantic cache store failed")
+
+def semantic_cache_clear():
+    """Drop every response in the semantic cache"""
+    try:
+        _semantic_cache().clear()
+    except Exception:
+        logger.exception("Semantic cache clear failed")
 
 # ==================== AI INTEGRATION ====================
 
-def call_groq_api(prompt: str, language: str = "en") -> str:
-    """Call Groq LLaMA API"""
+def _groq_messages(prompt: str, language: str) -> List[Dict]:
+    """Build chat messages for a Groq completion
+    
+    The system message is byte-identical across calls and prompts lead with
+    their static instructions, so the provider can reuse the cached prefix.
+    Anything per-call, including the language, goes at the end.
+    """
+    if language != "en":
+        prompt = f"{prompt}\n\nRespond in {language} language."
+    
+    return [
+        {"role": "system", "content": SYSTEM_PREFIX},
+        {"role": "user", "content": prompt}
+    ]
+
+@st.cache_resource(show_spinner=False)
+def get_groq_client() -> Groq:
+    """Groq client shared across reruns and sessions so its connection pool stays warm"""
+    return Groq(api_key=GROQ_API_KEY, max_retries=2, timeout=30.0)
+
+def _groq_create(prompt: str, language: str, model: str = GROQ_MODEL, json_mode: bool = False) -> str:
+    """Raw Groq completion"""
+    extra = {"response_format": {"type": "json_object"}} if json_mode else {}
+    response = get_groq_client().chat.completions.create(
+        model=model,
+        messages=_groq_messages(prompt, language),
+        temperature=0.9,
+        max_tokens=2000,
+        **extra
+    )
+    
+    return response.choices[0].message.content
+
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
+def _groq_completion(prompt: str, language: str, model: str = GROQ_MODEL, json_mode: bool = False) -> str:
+    """Groq completion, cached by prompt, language, model and response format"""
+    return _groq_create(prompt, language, model, json_mode)
+
+def call_groq_api(prompt: str, language: str = "en", semantic_key: Optional[Tuple[str, str]] = None,
+                  json_mode: bool = False, fresh: bool = False) -> str:
+    """Call Groq LLaMA API
+    
+    semantic_key is a (namespace, text) pair; near-duplicate text within the
+    same namespace is served from the semantic cache. json_mode constrains the
+    response to a single JSON object. fresh skips both caches for explicit
+    regenerate actions; the new response replaces its near-duplicates in the
+    semantic cache, but the st.cache_data entry for the prompt keeps the old text.
+    """
+    if semantic_key and not fresh:
+        cached = semantic_cache_lookup(*semantic_key)
+        if cached is not None:
+            return cached
+    
     try:
-        from groq import Groq
-        client = Groq(api_key=GROQ_API_KEY)
-        
-        language_instruction = f"Respond in {language} language." if language != "en" else ""
+        complete = _groq_create if fresh else _groq_completion
+        response = complete(prompt, language, json_mode=json_mode)
+    except Exception as e:
+        return f"Error calling Groq API: {str(e)}"
+    
+    if semantic_key:
+        semantic_cache_store(*semantic_key, response)
+    return response
+
+def stream_groq_api(prompt: str, language: str = "en") -> Iterator[str]:
+    """Stream Groq LLaMA API response text as it is generated"""
+    try:
+        stream = get_groq_client().chat.completions.create(
+            model=GROQ_MODEL,
+            messages=_groq_messages(prompt, language),
+            temperature=0.9,
+            max_tokens=2000,
+            stream=True
+        )
         
-        response = client.chat.completions.create(
-            model="llama-3.3-70b-versatile",
-            messages=[
-                {"role": "system", "content": f"You are a creative branding expert. {language_instruction}"},
-                {"role": "user", "content": prompt}
-            ],
+        for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                yield delta
+    except Exception as e:
+        yield f"Error calling Groq API: {str(e)}"
+
+@st.cache_resource(show_spinner=False)
+def _async_event_loop() -> asyncio.AbstractEventLoop:
+    """Background event loop shared across reruns for concurrent API calls"""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="brandforge-async", daemon=True).start()
+    return loop
+
+@st.cache_resource(show_spinner=False)
+def _async_groq_client() -> AsyncGroq:
+    """Async Groq client whose connection pool is reused across calls"""
+    return AsyncGroq(api_key=GROQ_API_KEY, max_retries=2, timeout=30.0)
+
+def run_async(coro):
+    """Run a coroutine on the background event loop and wait for its result"""
+    return asyncio.run_coroutine_threadsafe(coro, _async_event_loop()).result()
+
+async def acall_groq_api(prompt: str, language: str = "en", semantic_key: Optional[Tuple[str, str]] = None,
+                         fresh: bool = False) -> str:
+    """Call Groq LLaMA API without blocking the event loop"""
+    if semantic_key and not fresh:
+        cached = await asyncio.to_thread(semantic_cache_lookup, *semantic_key)
+        if cached is not None:
+            return cached
+    
+    try:
+        response = await _async_groq_client().chat.completions.create(
+            model=GROQ_MODEL,
+            messages=_groq_messages(prompt, language),
             temperature=0.9,
             max_tokens=2000
         )
-        
-        return response.choices[0].message.content
+        content = response.choices[0].message.content
     except Exception as e:
         return f"Error calling Groq API: {str(e)}"
+    
+    if semantic_key:
+        await asyncio.to_thread(semantic_cache_store, *semantic_key, content)
+    return content
 
-def generate_brand_names(business_description: str, industry: str, language: str, count: int = 10) -> List[str]:
-    """Generate creative brand names using advanced linguistic techniques"""
+def _section_pattern(section_names: List[str]) -> re.Pattern:
+    """Compile a pattern matching 'LABEL: content' blocks up to the next label"""
+    tags = "|".join(re.escape(name) for name in section_names)
+    return re.compile(
+        rf'^[ \t]*(?P<tag>{tags}):(?P<body>.*?)(?=^[ \t]*(?:{tags}):|\Z)',
+        re.MULTILINE | re.DOTALL
+    )
+
+_NUMBERING_RE = re.compile(r'^\d+[\.\)]\s*')
+_HEX_RE = re.compile(r'#[0-9A-Fa-f]{6}')
+_STORY_RE = _section_pattern(STORY_SECTIONS)
+_MARKETING_RE = _section_pattern(MARKETING_SECTIONS)
+
+def parse_labeled_sections(response: str, section_names: List[str],
+                           pattern: Optional[re.Pattern] = None) -> Dict[str, str]:
+    """Parse 'LABEL: content' sections into a dict keyed by lower-case label"""
     
-    lang_code = LANGUAGES.get(language, "en")
-    lang_instruction = f"Generate all names in {language} language." if language != "English" else ""
+    sections = {name.lower(): "" for name in section_names}
     
-    prompt = f"""Generate {count} highly creative, distinctive, and emotionally engaging brand names for a business with the following details:
-
-Business Description: {business_description}
-Industry: {industry}
+    for match in (pattern or _section_pattern(section_names)).finditer(response):
+        # Continuation lines are joined with single spaces
+        sections[match.group('tag').lower()] = " ".join(match.group('body').split())
+    
+    return sections
 
-{lang_instruction}
+BRAND_NAMES_INSTRUCTIONS = """Generate highly creative, distinctive, and emotionally engaging brand names for the business described at the end.
 
 Use advanced techniques:
 1. Linguistic Blending: Merge meaningful words in unexpected ways
@@ -200,9 +540,23 @@ Avoid:
 - Overused suffixes like "-ly", "-ify"
 - Common dictionary words without modification
 
-Return ONLY the {count} brand names, one per line, without numbering or explanations."""
+Return ONLY the requested number of brand names, one per line, without numbering or explanations."""
+
+def _brand_names_prompt(business_description: str, industry: str, language: str, count: int) -> Tuple[str, str]:
+    """Build prompt for brand name generation, returning (language code, prompt)"""
+    
+    lang_code, lang_instruction = lang_params(language, "Generate all names")
+    
+    return lang_code, f"""{BRAND_NAMES_INSTRUCTIONS}
+
+Number of names: {count}
+Business Description: {business_description}
+Industry: {industry}
+
+{lang_instruction}""".rstrip()
 
-    response = call_groq_api(prompt, lang_code)
+def _parse_brand_names(response: str, count: int) -> List[str]:
+    """Parse brand names from model response"""
     names = [name.strip() for name in response.split('\n') if name.strip() and not name.strip().startswith('#')]
     
     # Filter and ensure uniqueness
@@ -210,24 +564,30 @@ Return ONLY the {count} brand names, one per line, without numbering or explanat
     seen = set()
     for name in names:
         # Remove numbering if present
-        clean_name = re.sub(r'^\d+[\.\)]\s*', '', name).strip()
+        clean_name = _NUMBERING_RE.sub('', name).strip()
         if clean_name and clean_name.lower() not in seen:
             unique_names.append(clean_name)
             seen.add(clean_name.lower())
     
     return unique_names[:count]
 
-def generate_taglines(brand_name: str, business_description: str, language: str, count: int = 3) -> List[str]:
-    """Generate compelling taglines"""
-    
-    lang_code = LANGUAGES.get(language, "en")
-    lang_instruction = f"Generate all taglines in {language} language." if language != "English" else ""
+def generate_brand_names(business_description: str, industry: str, language: str, count: int = 10,
+                         fresh: bool = False) -> List[str]:
+    """Generate creative brand names using advanced linguistic techniques"""
     
-    prompt = f"""Create {count} memorable, impactful taglines for the brand "{brand_name}".
+    lang_code, prompt = _brand_names_prompt(business_description, industry, language, count)
+    semantic_key = (f"brand_names|{lang_code}|{count}", f"{industry}|{business_description}")
+    return _parse_brand_names(call_groq_api(prompt, lang_code, semantic_key, fresh=fresh), count)
 
-Business Description: {business_description}
+async def agenerate_brand_names(business_description: str, industry: str, language: str, count: int = 10,
+                                fresh: bool = False) -> List[str]:
+    """Async variant of generate_brand_names"""
+    
+    lang_code, prompt = _brand_names_prompt(business_description, industry, language, count)
+    semantic_key = (f"brand_names|{lang_code}|{count}", f"{industry}|{business_description}")
+    return _parse_brand_names(await acall_groq_api(prompt, lang_code, semantic_key, fresh=fresh), count)
 
-{lang_instruction}
+TAGLINES_INSTRUCTIONS = """Create memorable, impactful taglines for the brand described at the end.
 
 Each tagline should:
 - Be concise (3-7 words)
@@ -235,24 +595,43 @@ Each tagline should:
 - Communicate unique value
 - Be memorable and quotable
 
-Return ONLY the {count} taglines, one per line."""
+Return ONLY the requested number of taglines, one per line."""
 
-    response = call_groq_api(prompt, lang_code)
+def _taglines_prompt(brand_name: str, business_description: str, language: str, count: int) -> Tuple[str, str]:
+    """Build prompt for tagline generation, returning (language code, prompt)"""
+    
+    lang_code, lang_instruction = lang_params(language, "Generate all taglines")
+    
+    return lang_code, f"""{TAGLINES_INSTRUCTIONS}
+
+Number of taglines: {count}
+Brand: {brand_name}
+Business Description: {business_description}
+
+{lang_instruction}""".rstrip()
+
+def _parse_taglines(response: str, count: int) -> List[str]:
+    """Parse taglines from model response"""
     taglines = [t.strip() for t in response.split('\n') if t.strip()]
     return taglines[:count]
 
-def generate_brand_story(brand_name: str, business_description: str, industry: str, language: str) -> Dict[str, str]:
-    """Generate compelling brand story with structured sections"""
-    
-    lang_code = LANGUAGES.get(language, "en")
-    lang_instruction = f"Write the entire story in {language} language." if language != "English" else ""
+def generate_taglines(brand_name: str, business_description: str, language: str, count: int = 3,
+                      fresh: bool = False) -> List[str]:
+    """Generate compelling taglines"""
     
-    prompt = f"""Create a compelling, vivid, and emotionally persuasive brand story for "{brand_name}".
+    lang_code, prompt = _taglines_prompt(brand_name, business_description, language, count)
+    semantic_key = (f"taglines|{lang_code}|{count}|{brand_name}", business_description)
+    return _parse_taglines(call_groq_api(prompt, lang_code, semantic_key, fresh=fresh), count)
 
-Business Description: {business_description}
-Industry: {industry}
+async def agenerate_taglines(brand_name: str, business_description: str, language: str, count: int = 3,
+                             fresh: bool = False) -> List[str]:
+    """Async variant of generate_taglines"""
+    
+    lang_code, prompt = _taglines_prompt(brand_name, business_description, language, count)
+    semantic_key = (f"taglines|{lang_code}|{count}|{brand_name}", business_description)
+    return _parse_taglines(await acall_groq_api(prompt, lang_code, semantic_key, fresh=fresh), count)
 
-{lang_instruction}
+BRAND_STORY_INSTRUCTIONS = """Create a compelling, vivid, and emotionally persuasive brand story for the brand described at the end.
 
 Structure the story into these sections with rich storytelling:
 
@@ -280,51 +659,40 @@ PROBLEM: [content]
 SOLUTION: [content]
 POSITIONING: [content]"""
 
-    response = call_groq_api(prompt, lang_code)
+def _brand_story_prompt(brand_name: str, business_description: str, industry: str, language: str) -> Tuple[str, str]:
+    """Build prompt for brand story generation, returning (language code, prompt)"""
     
-    # Parse structured response
-    story = {
-        "vision": "",
-        "mission": "",
-        "problem": "",
-        "solution": "",
-        "positioning": ""
-    }
+    lang_code, lang_instruction = lang_params(language, "Write the entire story")
     
-    current_section = None
-    for line in response.split('\n'):
-        line = line.strip()
-        if line.startswith('VISION:'):
-            current_section = 'vision'
-            story[current_section] = line.replace('VISION:', '').strip()
-        elif line.startswith('MISSION:'):
-            current_section = 'mission'
-            story[current_section] = line.replace('MISSION:', '').strip()
-        elif line.startswith('PROBLEM:'):
-            current_section = 'problem'
-            story[current_section] = line.replace('PROBLEM:', '').strip()
-        elif line.startswith('SOLUTION:'):
-            current_section = 'solution'
-            story[current_section] = line.replace('SOLUTION:', '').strip()
-        elif line.startswith('POSITIONING:'):
-            current_section = 'positioning'
-            story[current_section] = line.replace('POSITIONING:', '').strip()
-        elif current_section and line:
-            story[current_section] += ' ' + line
-    
-    return story
-
-def generate_marketing_content(brand_name: str, business_description: str, language: str) -> Dict[str, str]:
-    """Generate various marketing content"""
+    return lang_code, f"""{BRAND_STORY_INSTRUCTIONS}
+
+Brand: {brand_name}
+Business Description: {business_description}
+Industry: {industry}
+
+{lang_instruction}""".rstrip()
+
+def _parse_brand_story(response: str) -> Dict[str, str]:
+    """Parse structured brand story sections from model response"""
+    return parse_labeled_sections(response, STORY_SECTIONS, _STORY_RE)
+
+def generate_brand_story(brand_name: str, business_description: str, industry: str, language: str,
+                         fresh: bool = False) -> Dict[str, str]:
+    """Generate compelling brand story with structured sections"""
     
-    lang_code = LANGUAGES.get(language, "en")
-    lang_instruction = f"Write all content in {language} language." if language != "English" else ""
+    lang_code, prompt = _brand_story_prompt(brand_name, business_description, industry, language)
+    semantic_key = (f"brand_story|{lang_code}|{brand_name}", f"{industry}|{business_description}")
+    return _parse_brand_story(call_groq_api(prompt, lang_code, semantic_key, fresh=fresh))
+
+async def agenerate_brand_story(brand_name: str, business_description: str, industry: str, language: str,
+                                fresh: bool = False) -> Dict[str, str]:
+    """Async variant of generate_brand_story"""
     
-    prompt = f"""Create marketing content for "{brand_name}".
+    lang_code, prompt = _brand_story_prompt(brand_name, business_description, industry, language)
+    semantic_key = (f"brand_story|{lang_code}|{brand_name}", f"{industry}|{business_description}")
+    return _parse_brand_story(await acall_groq_api(prompt, lang_code, semantic_key, fresh=fresh))
 
-Business: {business_description}
-
-{lang_instruction}
+MARKETING_INSTRUCTIONS = """Create marketing content for the brand described at the end.
 
 Generate:
 1. SHORT_DESCRIPTION: 1-2 sentence elevator pitch
@@ -340,45 +708,39 @@ SOCIAL_CAPTION: [content]
 AD_COPY: [content]
 EMAIL_COPY: [content]"""
 
-    response = call_groq_api(prompt, lang_code)
+def _marketing_content_prompt(brand_name: str, business_description: str, language: str) -> Tuple[str, str]:
+    """Build prompt for marketing content generation, returning (language code, prompt)"""
     
-    content = {
-        "short_description": "",
-        "long_description": "",
-        "social_caption": "",
-        "ad_copy": "",
-        "email_copy": ""
-    }
+    lang_code, lang_instruction = lang_params(language, "Write all content")
     
-    current_section = None
-    for line in response.split('\n'):
-        line = line.strip()
-        if line.startswith('SHORT_DESCRIPTION:'):
-            current_section = 'short_description'
-            content[current_section] = line.replace('SHORT_DESCRIPTION:', '').strip()
-        elif line.startswith('LONG_DESCRIPTION:'):
-            current_section = 'long_description'
-            content[current_section] = line.replace('LONG_DESCRIPTION:', '').strip()
-        elif line.startswith('SOCIAL_CAPTION:'):
-            current_section = 'social_caption'
-            content[current_section] = line.replace('SOCIAL_CAPTION:', '').strip()
-        elif line.startswith('AD_COPY:'):
-            current_section = 'ad_copy'
-            content[current_section] = line.replace('AD_COPY:', '').strip()
-        elif line.startswith('EMAIL_COPY:'):
-            current_section = 'email_copy'
-            content[current_section] = line.replace('EMAIL_COPY:', '').strip()
-        elif current_section and line:
-            content[current_section] += ' ' + line
+    return lang_code, f"""{MARKETING_INSTRUCTIONS}
+
+Brand: {brand_name}
+Business: {business_description}
+
+{lang_instruction}""".rstrip()
+
+def _parse_marketing_content(response: str) -> Dict[str, str]:
+    """Parse marketing content sections from model response"""
+    return parse_labeled_sections(response, MARKETING_SECTIONS, _MARKETING_RE)
+
+def generate_marketing_content(brand_name: str, business_description: str, language: str,
+                               fresh: bool = False) -> Dict[str, str]:
+    """Generate various marketing content"""
     
-    return content
+    lang_code, prompt = _marketing_content_prompt(brand_name, business_description, language)
+    semantic_key = (f"marketing|{lang_code}|{brand_name}", business_description)
+    return _parse_marketing_content(call_groq_api(prompt, lang_code, semantic_key, fresh=fresh))
 
-def generate_color_palette(brand_name: str, industry: str, style: str) -> List[str]:
-    """Generate color palette based on style"""
+async def agenerate_marketing_content(brand_name: str, business_description: str, language: str,
+                                      fresh: bool = False) -> Dict[str, str]:
+    """Async variant of generate_marketing_content"""
     
-    prompt = f"""Generate a color palette for brand "{brand_name}" in the {industry} industry.
+    lang_code, prompt = _marketing_content_prompt(brand_name, business_description, language)
+    semantic_key = (f"marketing|{lang_code}|{brand_name}", business_description)
+    return _parse_marketing_content(await acall_groq_api(prompt, lang_code, semantic_key, fresh=fresh))
 
-Style: {style} - {COLOR_PALETTE_STYLES[style]}
+COLOR_PALETTE_INSTRUCTIONS = """Generate a color palette for the brand described at the end, in the given style.
 
 Return exactly 5 HEX color codes (including #) that work harmoniously together.
 Format: one HEX code per line, nothing else.
@@ -390,10 +752,34 @@ Example format:
 #E6E6FA
 #F0E68C"""
 
-    response = call_groq_api(prompt, "en")
+def _color_palette_prompt(brand_name: str, industry: str, style: str) -> str:
+    """Build prompt for color palette generation"""
+    
+    return f"""{COLOR_PALETTE_INSTRUCTIONS}
+
+Brand: {brand_name}
+Industry: {industry}
+Style: {style} - {COLOR_PALETTE_STYLES[style]}"""
+
+def _dedupe_colors(hex_codes: List[str], min_distance: int = PALETTE_MIN_DISTANCE) -> List[str]:
+    """Drop colors that are within min_distance (RGB euclidean) of an earlier color"""
+    
+    min_sq = min_distance * min_distance
+    kept, kept_rgb = [], []
+    
+    for code in hex_codes:
+        rgb = (int(code[1:3], 16), int(code[3:5], 16), int(code[5:7], 16))
+        if all((rgb[0] - r) ** 2 + (rgb[1] - g) ** 2 + (rgb[2] - b) ** 2 >= min_sq for r, g, b in kept_rgb):
+            kept.append(code)
+            kept_rgb.append(rgb)
+    
+    return kept
+
+def _parse_color_palette(response: str, style: str) -> List[str]:
+    """Extract HEX codes from model response, falling back to a preset palette"""
     
-    # Extract HEX codes
-    hex_codes = re.findall(r'#[0-9A-Fa-f]{6}', response)
+    # Extract HEX codes, dropping near-duplicates
+    hex_codes = _dedupe_colors(_HEX_RE.findall(response))
     
     # Fallback palettes if API fails
     fallback_palettes = {
@@ -411,33 +797,272 @@ Example format:
     else:
         return fallback_palettes.get(style, fallback_palettes["Pastel"])
 
-def generate_font_pairing(brand_name: str, industry: str) -> Dict[str, str]:
-    """Generate font pairing recommendations"""
+def generate_color_palette(brand_name: str, industry: str, style: str, fresh: bool = False) -> List[str]:
+    """Generate color palette based on style"""
     
-    # For simplicity, use predefined pairings based on industry
-    industry_pairings = {
-        "Technology": {"logo": "Montserrat", "heading": "Poppins", "body": "Inter"},
-        "Fashion": {"logo": "Playfair Display", "heading": "Lato", "body": "Source Sans Pro"},
-        "Food": {"logo": "Bebas Neue", "heading": "Open Sans", "body": "Nunito"},
-        "Health": {"logo": "Raleway", "heading": "Roboto", "body": "Work Sans"},
-        "Finance": {"logo": "Oswald", "heading": "Merriweather", "body": "Karla"},
+    prompt = _color_palette_prompt(brand_name, industry, style)
+    return _parse_color_palette(call_groq_api(prompt, "en", fresh=fresh), style)
+
+async def agenerate_color_palette(brand_name: str, industry: str, style: str,
+                                  fresh: bool = False) -> List[str]:
+    """Async variant of generate_color_palette"""
+    
+    prompt = _color_palette_prompt(brand_name, industry, style)
+    return _parse_color_palette(await acall_groq_api(prompt, "en", fresh=fresh), style)
+
+async def _agenerate_brand_bundle(brand_name: str, business_description: str, industry: str,
+                                  language: str, palette_style: str, fresh: bool = False) -> Dict:
+    """Run the independent brand generations concurrently"""
+    
+    taglines, story, marketing, colors = await asyncio.gather(
+        agenerate_taglines(brand_name, business_description, language, fresh=fresh),
+        agenerate_brand_story(brand_name, business_description, industry, language, fresh=fresh),
+        agenerate_marketing_content(brand_name, business_description, language, fresh=fresh),
+        agenerate_color_palette(brand_name, industry, palette_style, fresh=fresh)
+    )
+    
+    return {
+        "taglines": taglines,
+        "story": story,
+        "marketing": marketing,
+        "colors": colors
+    }
+
+def generate_brand_bundle(brand_name: str, business_description: str, industry: str,
+                          language: str, palette_style: str = "Pastel", fresh: bool = False) -> Dict:
+    """Generate taglines, brand story, marketing content and palette in one concurrent round trip"""
+    return run_async(_agenerate_brand_bundle(brand_name, business_description, industry, language, palette_style, fresh))
+
+async def _agenerate_everything(business_description: str, industry: str, language: str, palette_style: str,
+                                fresh: bool = False) -> Dict:
+    """Generate names, then fan out every name-dependent generation for the top name"""
+    
+    names = await agenerate_brand_names(business_description, industry, language, fresh=fresh)
+    if not names:
+        return {"names": []}
+    
+    bundle = await _agenerate_brand_bundle(names[0], business_description, industry, language, palette_style, fresh)
+    return {"names": names, "selected_name": names[0], **bundle}
+
+def generate_everything(business_description: str, industry: str, language: str, palette_style: str = "Pastel",
+                        fresh: bool = False) -> Dict:
+    """Generate the full brand kit: names first, then taglines, story, marketing and palette concurrently"""
+    return run_async(_agenerate_everything(business_description, industry, language, palette_style, fresh))
+
+BRAND_KIT_INSTRUCTIONS = """Create a complete brand kit for the business described at the end.
+
+1. Invent 10 highly creative, distinctive brand names using linguistic blending, metaphorical framing, phonetic rhythm, industry relevance and emotional resonance. Avoid generic compound words and overused suffixes like "-ly", "-ify".
+2. Choose the strongest name as the primary brand and write everything else for it.
+3. Write 3 concise (3-7 words), memorable taglines.
+4. Write a vivid, emotionally persuasive brand story: vision, mission, problem, solution and positioning.
+5. Write marketing content: a 1-2 sentence elevator pitch, a 3-4 paragraph description, a social media caption with emojis, a 30-second ad script and a professional email introduction.
+6. Pick 5 harmonious HEX colors in the requested palette style.
+
+Return ONLY a JSON object with exactly these fields:
+{
+  "names": ["10 brand names, primary brand first"],
+  "taglines": ["3 taglines"],
+  "story": {"vision": "", "mission": "", "problem": "", "solution": "", "positioning": ""},
+  "marketing": {"short_description": "", "long_description": "", "social_caption": "", "ad_copy": "", "email_copy": ""},
+  "colors": ["5 HEX codes including #"]
+}"""
+
+def _full_brand_kit_prompt(business_description: str, industry: str, language: str, palette_style: str) -> Tuple[str, str]:
+    """Build a single JSON-mode prompt that returns every brand kit field, returning (language code, prompt)"""
+    
+    lang_code, lang_instruction = lang_params(language, "Write all names and content")
+    
+    return lang_code, f"""{BRAND_KIT_INSTRUCTIONS}
+
+Business Description: {business_description}
+Industry: {industry}
+Palette Style: {palette_style} - {COLOR_PALETTE_STYLES[palette_style]}
+
+{lang_instruction}""".rstrip()
+
+def _string_fields_schema(section_names: List[str]) -> Dict:
+    """JSON schema for an object with a required string field per lower-cased section"""
+    return {
+        "type": "object",
+        "properties": {name.lower(): {"type": "string"} for name in section_names},
+        "required": [name.lower() for name in section_names]
     }
+
+BRAND_KIT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "names": {"type": "array", "items": {"type": "string"}, "minItems": 1},
+        "taglines": {"type": "array", "items": {"type": "string"}},
+        "story": _string_fields_schema(STORY_SECTIONS),
+        "marketing": _string_fields_schema(MARKETING_SECTIONS),
+        "colors": {"type": "array", "items": {"type": "string"}}
+    },
+    "required": ["names", "taglines", "story", "marketing", "colors"]
+}
+
+@st.cache_resource(show_spinner=False)
+def _brand_kit_validator() -> Draft202012Validator:
+    """Compiled BRAND_KIT_SCHEMA validator, built once per process rather than on every rerun"""
+    return Draft202012Validator(BRAND_KIT_SCHEMA)
+
+def _parse_brand_kit(response: str, palette_style: str) -> Dict:
+    """Parse and validate a JSON-mode brand kit response
+    
+    A response that is not valid JSON or does not match BRAND_KIT_SCHEMA
+    yields a kit without names, so nothing partial reaches the session.
+    """
+    
+    try:
+        kit = orjson.loads(response)
+        _brand_kit_validator().validate(kit)
+    except (orjson.JSONDecodeError, ValidationError):
+        return {"names": []}
+    
+    names = _parse_brand_names("\n".join(kit["names"]), 10)
+    
+    bundle = {
+        "names": names,
+        "taglines": _parse_taglines("\n".join(kit["taglines"]), 3),
+        "story": {name.lower(): kit["story"][name.lower()] for name in STORY_SECTIONS},
+        "marketing": {name.lower(): kit["marketing"][name.lower()] for name in MARKETING_SECTIONS},
+        "colors": _parse_color_palette(" ".join(kit["colors"]), palette_style)
+    }
+    if names:
+        bundle["selected_name"] = names[0]
+    
+    return bundle
+
+def generate_full_brand_kit(business_description: str, industry: str, language: str,
+                            palette_style: str = "Pastel", fresh: bool = False) -> Dict:
+    """Generate names, taglines, story, marketing content and palette with a single JSON-mode Groq call"""
+    
+    lang_code, prompt = _full_brand_kit_prompt(business_description, industry, language, palette_style)
+    return _parse_brand_kit(call_groq_api(prompt, lang_code, json_mode=True, fresh=fresh), palette_style)
+
+def generate_brand_kit(business_description: str, industry: str, language: str,
+                       palette_style: str = "Pastel", fresh: bool = False) -> Dict:
+    """Generate the brand kit in one JSON-mode call, falling back to the per-section generators"""
+    
+    kit = generate_full_brand_kit(business_description, industry, language, palette_style, fresh)
+    if kit['names']:
+        return kit
+    return generate_everything(business_description, industry, language, palette_style, fresh)
+
+def submit_brand_batch(prompts: Dict[str, str], language: str = "en") -> Dict[str, str]:
+    """Run prompts through the Groq Batch API and return responses keyed like the input"""
+    
+    client = get_groq_client()
+    
+    buffer = BytesIO()
+    for key, prompt in prompts.items():
+        request = {
+            "custom_id": key,
+            "method": "POST",
+            "url": BATCH_ENDPOINT,
+            "body": {
+                "model": GROQ_MODEL,
+                "messages": _groq_messages(prompt, language),
+                "temperature": 0.9,
+                "max_tokens": 2000
+            }
+        }
+        buffer.write(orjson.dumps(request) + b"\n")
+    
+    batch_file = client.files.create(file=("brand_batch.jsonl", buffer.getvalue()), purpose="batch")
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint=BATCH_ENDPOINT,
+        completion_window="24h"
+    )
+    
+    # Poll with exponential backoff until the batch settles
+    delay = 2.0
+    deadline = time.monotonic() + BATCH_TIMEOUT_SECONDS
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        if time.monotonic() > deadline:
+            # Nobody will collect the output, so stop paying for it
+            client.batches.cancel(batch.id)
+            raise TimeoutError(f"Batch {batch.id} still {batch.status} after {BATCH_TIMEOUT_SECONDS}s")
+        time.sleep(delay)
+        delay = min(delay * 2, 30.0)
+        batch = client.batches.retrieve(batch.id)
+    
+    if batch.status != "completed" or not batch.output_file_id:
+        raise RuntimeError(f"Batch {batch.id} {batch.status}")
+    
+    output = client.files.content(batch.output_file_id).read().decode("utf-8")
+    
+    responses = {}
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        result = orjson.loads(line)
+        body = (result.get("response") or {}).get("body") or {}
+        choices = body.get("choices") or []
+        if choices:
+            responses[result["custom_id"]] = choices[0]["message"]["content"]
+    
+    return responses
+
+def generate_brand_bundle_batch(brand_name: str, business_description: str, industry: str,
+                                language: str, palette_style: str = "Pastel", fresh: bool = True) -> Dict:
+    """Generate the brand bundle as a single Groq batch job (cheaper, slower)
+    
+    Batch jobs never read the caches; fresh only mirrors generate_brand_bundle.
+    """
+    
+    lang_code, taglines_prompt = _taglines_prompt(brand_name, business_description, language, 3)
     
-    # Default pairing
-    default = {"logo": "Montserrat", "heading": "Poppins", "body": "Inter"}
+    responses = submit_brand_batch({
+        "taglines": taglines_prompt,
+        "story": _brand_story_prompt(brand_name, business_description, industry, language)[1],
+        "marketing": _marketing_content_prompt(brand_name, business_description, language)[1],
+        "colors": _color_palette_prompt(brand_name, industry, palette_style)
+    }, lang_code)
     
-    for key in industry_pairings:
-        if key.lower() in industry.lower():
-            return industry_pairings[key]
+    return {
+        "taglines": _parse_taglines(responses.get("taglines", ""), 3),
+        "story": _parse_brand_story(responses.get("story", "")),
+        "marketing": _parse_marketing_content(responses.get("marketing", "")),
+        "colors": _parse_color_palette(responses.get("colors", ""), palette_style)
+    }
+
+# Leftmost industry keyword wins; group names are the lower-cased keys
+_INDUSTRY_RE = re.compile("|".join(
+    f"(?P<{key.lower()}>{re.escape(key.lower())})" for key in INDUSTRY_FONT_PAIRINGS
+))
+_INDUSTRY_KEYS = {key.lower(): key for key in INDUSTRY_FONT_PAIRINGS}
+
+def generate_font_pairing(brand_name: str, industry: str) -> Dict[str, str]:
+    """Generate font pairing recommendations"""
+    
+    # For simplicity, use predefined pairings based on industry
+    match = _INDUSTRY_RE.search(industry.lower())
+    pairing = INDUSTRY_FONT_PAIRINGS[_INDUSTRY_KEYS[match.lastgroup]] if match else DEFAULT_FONT_PAIRING
     
-    return default
+    return dict(pairing)
+
+NEUTRAL_SENTIMENT = {
+    "polarity": 0.0,
+    "confidence": 0.0,
+    "tone": "Neutral",
+    "alignment": "Unknown"
+}
+
+@st.cache_resource(show_spinner=False)
+def _vader():
+    """VADER analyzer with its lexicon loaded once per process, imported on first analysis"""
+    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+    return SentimentIntensityAnalyzer()
 
 def perform_sentiment_analysis(text: str) -> Dict:
     """Analyze sentiment of text"""
     try:
-        blob = TextBlob(text)
-        polarity = blob.sentiment.polarity
-        subjectivity = blob.sentiment.subjectivity
+        # VADER's lexicon is English-only
+        if cached_detect(text) != "en":
+            return dict(NEUTRAL_SENTIMENT)
+        
+        polarity = _vader().polarity_scores(text)['compound']
         
         # Determine tone
         if polarity > 0.3:
@@ -447,7 +1072,7 @@ def perform_sentiment_analysis(text: str) -> Dict:
         else:
             tone = "Neutral"
         
-        # Confidence (based on subjectivity)
+        # Confidence (based on polarity strength)
         confidence = abs(polarity) * 100
         
         return {
@@ -457,18 +1082,19 @@ def perform_sentiment_analysis(text: str) -> Dict:
             "alignment": "Good" if polarity > 0 else "Needs Improvement"
         }
     except:
-        return {
-            "polarity": 0.0,
-            "confidence": 0.0,
-            "tone": "Neutral",
-            "alignment": "Unknown"
-        }
+        return dict(NEUTRAL_SENTIMENT)
+
+@st.cache_data(ttl=60 * 60, max_entries=256, show_spinner=False)
+def sentiment(text: str) -> Dict:
+    """Sentiment of text, recomputed only when the text changes"""
+    if not text.strip():
+        return dict(NEUTRAL_SENTIMENT)
+    return perform_sentiment_analysis(text)
 
 def rewrite_for_sentiment(text: str, target_tone: str, language: str) -> str:
     """Rewrite text to match target sentiment"""
     
-    lang_code = LANGUAGES.get(language, "en")
-    lang_instruction = f"Write in {language} language." if language != "English" else ""
+    lang_code, lang_instruction = lang_params(language, "Write")
     
     prompt = f"""Rewrite the following text to have a {target_tone} tone while maintaining the core message:
 
@@ -483,8 +1109,7 @@ Return only the rewritten text."""
 def summarize_text(text: str, language: str) -> str:
     """Summarize long text"""
     
-    lang_code = LANGUAGES.get(language, "en")
-    lang_instruction = f"Summarize in {language} language." if language != "English" else ""
+    lang_code, lang_instruction = lang_params(language, "Summarize")
     
     prompt = f"""Summarize the following text concisely in 2-3 sentences:
 
@@ -499,65 +1124,243 @@ Return only the summary."""
 def generate_logo_prompt(brand_name: str, industry: str, colors: List[str], logo_type: str, sentiment: str) -> str:
     """Generate refined logo prompt for Stable Diffusion"""
     
-    color_desc = ", ".join(colors[:3])
+    mood = LOGO_SENTIMENT_MOODS.get(sentiment, "professional")
+    type_desc = LOGO_TYPE_DESCRIPTIONS.get(logo_type, "logo for {brand_name}").format(brand_name=brand_name)
     
-    sentiment_moods = {
-        "Positive": "energetic, vibrant, uplifting",
-        "Neutral": "balanced, professional, clean",
-        "Negative": "serious, bold, impactful"
+    return f"""Professional {type_desc}, {industry} industry, {mood} aesthetic, 
+vector style, clean design, modern, colors: {", ".join(colors[:3])}, 
+flat design, minimalist, high quality, centered composition, 
+white background, suitable for branding"""
+
+@st.cache_resource(show_spinner=False)
+def get_hf_session() -> requests.Session:
+    """HTTP session for HuggingFace Inference API with pooled keep-alive connections"""
+    session = requests.Session()
+    session.headers.update({"Authorization": f"Bearer {HF_API_TOKEN}"})
+    
+    # Ride out 503 "model loading" and 429 rate-limit responses
+    retries = Retry(
+        total=SDXL_MAX_RETRIES,
+        backoff_factor=1.0,
+        status_forcelist=SDXL_RETRY_STATUSES,
+        allowed_methods=["POST"],
+        raise_on_status=False
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries))
+    return session
+
+def _sdxl_payload(prompt: str, seed: Optional[int] = None) -> Dict:
+    """Build the SDXL inference request payload"""
+    
+    payload = {
+        "inputs": prompt,
+        "parameters": {
+            "num_inference_steps": SDXL_STEPS,
+            "guidance_scale": SDXL_GUIDANCE_SCALE,
+            "width": SDXL_SIZE,
+            "height": SDXL_SIZE
+        },
+        # Hold the request while a cold model loads instead of answering 503
+        "options": {"wait_for_model": True}
     }
     
-    mood = sentiment_moods.get(sentiment, "professional")
+    if seed:
+        payload["parameters"]["seed"] = seed
     
-    type_descriptions = {
-        "Lettermark": f"lettermark logo using initials of {brand_name}",
-        "Wordmark": f"wordmark logo with stylized text '{brand_name}'",
-        "Symbol-based": f"abstract symbol logo representing {brand_name} concept",
-        "Combination Mark": f"combination logo with both symbol and text '{brand_name}'"
-    }
+    return payload
+
+@st.cache_data(ttl=24 * 60 * 60, max_entries=SDXL_CACHE_ENTRIES, show_spinner=False)
+def _sdxl_png(prompt: str, seed: Optional[int] = None) -> bytes:
+    """Request a logo from SDXL and return the raw PNG bytes, cached by prompt and seed"""
     
-    type_desc = type_descriptions.get(logo_type, f"logo for {brand_name}")
+    response = get_hf_session().post(SDXL_API_URL, json=_sdxl_payload(prompt, seed))
+    response.raise_for_status()
+    return _ensure_png(response.content)
+
+def png_bytes(img) -> bytes:
+    """Encode a PIL image as PNG
     
-    prompt = f"""Professional {type_desc}, {industry} industry, {mood} aesthetic, 
-vector style, clean design, modern, colors: {color_desc}, 
-flat design, minimalist, high quality, centered composition, 
-white background, suitable for branding"""
+    compress_level=1 trades a slightly larger file for a fraction of the zlib time.
+    Not memoized; the SDXL caches already keep the encoded bytes.
+    """
+    buf = BytesIO()
+    img.save(buf, format="PNG", optimize=False, compress_level=1)
+    return buf.getvalue()
+
+def _ensure_png(data: bytes) -> bytes:
+    """Return image bytes as PNG, decoding only when they are in another format"""
+    if data.startswith(PNG_SIGNATURE):
+        return data
+    
+    # PIL is only needed for the rare non-PNG response
+    from PIL import Image
+    return png_bytes(Image.open(BytesIO(data)))
+
+@st.cache_resource(show_spinner="Loading Stable Diffusion XL...")
+def _local_sdxl() -> Dict:
+    """Local SDXL pipeline kept resident for the process, with a lock serializing inference"""
+    
+    # torch and diffusers are only needed for the local backend
+    import torch
+    from diffusers import StableDiffusionXLPipeline
+    
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    pipe = StableDiffusionXLPipeline.from_pretrained(
+        SDXL_MODEL_ID,
+        torch_dtype=torch.float16 if device == "cuda" else torch.float32,
+        variant="fp16" if device == "cuda" else None,
+        use_safetensors=True
+    )
+    pipe.to(device)
+    
+    # FP8 weights for the UNet and text encoders; the VAE stays FP16 for image quality
+    if SDXL_QUANTIZE and device == "cuda":
+        from optimum.quanto import freeze, qfloat8, quantize
+        
+        for module in (pipe.unet, pipe.text_encoder, pipe.text_encoder_2):
+            quantize(module, weights=qfloat8)
+            freeze(module)
+    
+    if SDXL_COMPILE:
+        pipe.unet = torch.compile(pipe.unet, mode="reduce-overhead", fullgraph=True)
+    
+    return {"pipe": pipe, "device": device, "lock": threading.Lock()}
+
+@st.cache_resource(show_spinner=False)
+def warm_local_sdxl() -> Optional[threading.Thread]:
+    """Start loading the local SDXL pipeline in the background, once per process"""
+    if SDXL_BACKEND != "local":
+        return None
+    
+    thread = threading.Thread(target=_local_sdxl, name="brandforge-sdxl-warmup", daemon=True)
+    thread.start()
+    return thread
+
+@st.cache_data(ttl=24 * 60 * 60, max_entries=SDXL_CACHE_ENTRIES, show_spinner=False)
+def _sdxl_local_pngs(prompt: str, seeds: Tuple[Optional[int], ...]) -> List[bytes]:
+    """Generate one logo per seed in a single batched forward pass of the local SDXL pipeline
+    
+    Each image gets its own seeded generator, so a seed renders the same logo
+    whether it is generated alone or in a batch.
+    """
+    import torch
     
-    return prompt
+    sdxl = _local_sdxl()
+    with sdxl["lock"]:
+        images = sdxl["pipe"](
+            [prompt] * len(seeds),
+            num_inference_steps=SDXL_STEPS,
+            guidance_scale=SDXL_GUIDANCE_SCALE,
+            width=SDXL_SIZE,
+            height=SDXL_SIZE,
+            generator=[torch.Generator(sdxl["device"]).manual_seed(seed or 0) for seed in seeds]
+        ).images
+    
+    return [png_bytes(image) for image in images]
 
-def generate_logo_sdxl(prompt: str, seed: Optional[int] = None) -> Optional[Image.Image]:
-    """Generate logo using Stable Diffusion XL via HuggingFace Inference API"""
+def generate_logo_sdxl(prompt: str, seed: Optional[int] = None) -> Optional[bytes]:
+    """Generate logo PNG bytes using Stable Diffusion XL via HuggingFace Inference API or a local pipeline"""
     
     try:
-        API_URL = "https://api-inference.huggingface.co/models/stabilityai/stable-diffusion-xl-base-1.0"
-        headers = {"Authorization": f"Bearer {HF_API_TOKEN}"}
-        
-        payload = {
-            "inputs": prompt,
-            "parameters": {
-                "num_inference_steps": 30,
-                "guidance_scale": 7.5,
-                "width": 1024,
-                "height": 1024
-            }
-        }
-        
-        if seed:
-            payload["parameters"]["seed"] = seed
-        
-        response = requests.post(API_URL, headers=headers, json=payload)
-        
-        if response.status_code == 200:
-            image = Image.open(BytesIO(response.content))
-            return image
-        else:
-            st.error(f"Logo generation failed: {response.status_code}")
-            return None
-            
+        if SDXL_BACKEND == "local":
+            return _sdxl_local_pngs(prompt, (seed,))[0]
+        return _sdxl_png(prompt, seed)
+    except requests.HTTPError as e:
+        st.error(f"Logo generation failed: {e.response.status_code}")
+        return None
     except Exception as e:
         st.error(f"Error generating logo: {str(e)}")
         return None
 
+@st.cache_resource(show_spinner=False)
+def _async_hf_client() -> httpx.AsyncClient:
+    """Async HTTP client for concurrent SDXL requests, shared across batches"""
+    return httpx.AsyncClient(timeout=60, headers={"Authorization": f"Bearer {HF_API_TOKEN}"})
+
+async def _agenerate_logo(client: httpx.AsyncClient, prompt: str, seed: Optional[int]) -> bytes:
+    """Request one logo from SDXL without blocking the event loop"""
+    
+    for attempt in range(SDXL_MAX_RETRIES + 1):
+        response = await client.post(SDXL_API_URL, json=_sdxl_payload(prompt, seed))
+        if response.status_code not in SDXL_RETRY_STATUSES or attempt == SDXL_MAX_RETRIES:
+            break
+        await asyncio.sleep(2 ** attempt)
+    
+    response.raise_for_status()
+    return _ensure_png(response.content)
+
+async def _agenerate_logo_variants(prompts_and_seeds: List[Tuple[str, Optional[int]]]) -> List:
+    """Request every logo variant concurrently over one connection pool"""
+    client = _async_hf_client()
+    return await asyncio.gather(
+        *(_agenerate_logo(client, prompt, seed) for prompt, seed in prompts_and_seeds),
+        return_exceptions=True
+    )
+
+def generate_logo_variants(prompts_and_seeds: List[Tuple[str, Optional[int]]]) -> List[bytes]:
+    """Generate several logos concurrently, returning PNG bytes for the ones that succeed"""
+    
+    if len(prompts_and_seeds) == 1:
+        logo = generate_logo_sdxl(*prompts_and_seeds[0])
+        return [logo] if logo else []
+    
+    # Locally, variations of the same prompt share one batched pipeline call
+    if SDXL_BACKEND == "local":
+        seeds_by_prompt: Dict[str, List[Optional[int]]] = {}
+        for prompt, seed in prompts_and_seeds:
+            seeds_by_prompt.setdefault(prompt, []).append(seed)
+        
+        try:
+            return [logo for prompt, seeds in seeds_by_prompt.items()
+                    for logo in _sdxl_local_pngs(prompt, tuple(seeds))]
+        except Exception as e:
+            st.error(f"Error generating variations: {str(e)}")
+            return []
+    
+    results = run_async(_agenerate_logo_variants(prompts_and_seeds))
+    
+    failures = [r for r in results if isinstance(r, Exception)]
+    if failures:
+        st.error(f"{len(failures)} of {len(results)} variations failed: {str(failures[0])}")
+    
+    return [r for r in results if not isinstance(r, Exception)]
+
+@st.cache_resource(show_spinner=False)
+def _prefetch_pool() -> ThreadPoolExecutor:
+    """Worker pool for speculative generation of the next dashboard step"""
+    return ThreadPoolExecutor(max_workers=3, thread_name_prefix="brandforge-prefetch")
+
+@st.cache_resource(show_spinner=False)
+def _foreground_pool() -> ThreadPoolExecutor:
+    """Worker pool for background jobs the user asked for, never queued behind speculative ones"""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="brandforge-foreground")
+
+def prefetch(name: str, fn, *args, pool: Optional[ThreadPoolExecutor] = None):
+    """Start fn(*args) in the background, remembered under name with its arguments
+    
+    Runs on the speculative prefetch pool unless another pool is given. A
+    superseded job is cancelled so it does not hold a shared worker; one that
+    has already started runs to completion and its result is dropped.
+    """
+    previous = st.session_state.prefetch.get(name)
+    if previous is not None:
+        previous[1].cancel()
+    st.session_state.prefetch[name] = (args, (pool or _prefetch_pool()).submit(fn, *args))
+
+def take_prefetched(name: str, *args):
+    """Return a prefetched result if it was started with the same arguments, else None"""
+    entry = st.session_state.prefetch.pop(name, None)
+    if entry is None:
+        return None
+    if entry[0] != args:
+        entry[1].cancel()
+        return None
+    
+    try:
+        return entry[1].result()
+    except Exception:
+        return None
+
 def chat_with_consultant(user_message: str, chat_history: List[Dict]) -> str:
     """AI Branding Consultant using Groq (fallback from IBM Granite)"""
     
@@ -583,10 +1386,111 @@ Provide helpful, structured guidance. Ask one focused question at a time."""
     response = call_groq_api(prompt, "en")
     return response
 
+# ==================== EXPORT ====================
+
+@st.cache_resource(show_spinner=False)
+def _pdf_fonts(family: str) -> Tuple[str, str]:
+    """Register a TTF family with ReportLab once per process, returning (regular, bold) font names"""
+    from reportlab.lib.fonts import addMapping
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+    
+    regular_path = os.path.join(PDF_FONT_DIR, f"{family}-Regular.ttf")
+    bold_path = os.path.join(PDF_FONT_DIR, f"{family}-Bold.ttf")
+    if not os.path.exists(regular_path):
+        logger.warning("PDF font %s not found, falling back to Helvetica", regular_path)
+        return "Helvetica", "Helvetica-Bold"
+    
+    regular, bold = family, f"{family}-Bold"
+    pdfmetrics.registerFont(TTFont(regular, regular_path))
+    if os.path.exists(bold_path):
+        pdfmetrics.registerFont(TTFont(bold, bold_path))
+    else:
+        bold = regular
+    
+    # Paragraph markup like <b> resolves through the family mapping
+    for is_bold, font in ((0, regular), (1, bold)):
+        for is_italic in (0, 1):
+            addMapping(regular, is_bold, is_italic, font)
+    
+    return regular, bold
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def build_brand_kit_pdf(brand_data: Dict, language: str = "English") -> bytes:
+    """Render the brand kit as a PDF with ReportLab Platypus, once per distinct brand data
+    
+    Text is set in the Noto family for the language's script. ReportLab does not
+    shape complex scripts, so Devanagari, Telugu and Tamil glyphs all render but
+    conjuncts and reordered vowel signs may appear in their unjoined forms.
+    """
+    
+    # ReportLab is imported on first use; most sessions never export a PDF
+    from xml.sax.saxutils import escape
+    from reportlab.graphics.shapes import Drawing, Rect, String
+    from reportlab.lib import colors as rl_colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.lib.units import mm
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
+    
+    regular, bold = _pdf_fonts(PDF_FONT_FAMILIES.get(LANGUAGES.get(language, "en"), PDF_DEFAULT_FONT_FAMILY))
+    styles = getSampleStyleSheet()
+    styles['Title'].fontName = bold
+    styles['Heading2'].fontName = bold
+    styles['BodyText'].fontName = regular
+    brand_name = brand_data.get('selected_name', 'Brand Kit')
+    
+    flowables = [
+        Paragraph(escape(brand_name), styles['Title']),
+        Spacer(1, 6 * mm)
+    ]
+    
+    # Taglines
+    if brand_data.get('taglines'):
+        flowables.append(Paragraph("<b>Taglines</b>", styles['Heading2']))
+        for tagline in brand_data['taglines']:
+            flowables.append(Paragraph(f"- {escape(tagline)}", styles['BodyText']))
+        flowables.append(Spacer(1, 4 * mm))
+    
+    # Story sections
+    story = brand_data.get('story', {})
+    for name in STORY_SECTIONS:
+        content = story.get(name.lower(), '')
+        if content:
+            flowables.append(Paragraph(f"<b>{name.title()}</b>", styles['Heading2']))
+            flowables.append(Paragraph(escape(content), styles['BodyText']))
+    
+    # Colors, drawn as swatches with their HEX codes underneath
+    if brand_data.get('colors'):
+        flowables.append(Paragraph("<b>Color Palette</b>", styles['Heading2']))
+        
+        swatch, gap = 25 * mm, 5 * mm
+        drawing = Drawing(len(brand_data['colors']) * (swatch + gap), swatch + 6 * mm)
+        for i, color in enumerate(brand_data['colors']):
+            x = i * (swatch + gap)
+            drawing.add(Rect(x, 6 * mm, swatch, swatch, fillColor=rl_colors.HexColor(color),
+                             strokeColor=rl_colors.lightgrey))
+            drawing.add(String(x, 0, color, fontName=regular, fontSize=9))
+        
+        flowables.append(drawing)
+        flowables.append(Spacer(1, 4 * mm))
+    
+    # Fonts
+    if brand_data.get('fonts'):
+        fonts = brand_data['fonts']
+        flowables.append(Paragraph("<b>Typography</b>", styles['Heading2']))
+        for label, key in [("Logo Font", 'logo'), ("Heading Font", 'heading'), ("Body Font", 'body')]:
+            flowables.append(Paragraph(f"{label}: {escape(fonts.get(key, 'N/A'))}", styles['BodyText']))
+    
+    buffer = BytesIO()
+    SimpleDocTemplate(buffer, pagesize=A4, title=brand_name).build(flowables)
+    return buffer.getvalue()
+
 # ==================== UI COMPONENTS ====================
 
-def apply_custom_css():
-    """Apply custom CSS for pastel glassmorphism theme"""
+@st.cache_resource(show_spinner=False)
+def _css_for(theme: str) -> str:
+    """Build the custom CSS block for a theme, once per process"""
     
     theme_colors = {
         "light": {
@@ -605,9 +1509,9 @@ def apply_custom_css():
         }
     }
     
-    colors = theme_colors[st.session_state.theme]
+    colors = theme_colors[theme]
     
-    css = f"""
+    return f"""
     <style>
     /* Global Styles */
     .stApp {{
@@ -734,8 +1638,27 @@ def apply_custom_css():
     }}
     </style>
     """
+
+_palette_picker = components.declare_component(
+    "palette_picker", path=str(Path(__file__).parent / "palette_picker")
+)
+
+def palette_picker(colors: List[str], key: Optional[str] = None) -> List[str]:
+    """Edit a whole palette with one component, returning the edited colors
     
-    st.markdown(css, unsafe_allow_html=True)
+    The component reports the palette it was editing alongside the edit, so an
+    edit made against a since-regenerated palette is ignored.
+    """
+    value = _palette_picker(colors=colors, key=key, default=None)
+    if value and value.get("base") == colors:
+        return value["colors"]
+    return colors
+
+def apply_custom_css():
+    """Apply custom CSS for pastel glassmorphism theme"""
+    
+    # Emitted on every rerun: Streamlit drops elements a rerun doesn't re-render
+    st.markdown(_css_for(st.session_state.theme), unsafe_allow_html=True)
 
 def render_auth_page():
     """Render authentication page"""
@@ -815,9 +1738,15 @@ def render_floating_chat():
             with col1:
                 if st.button("Send", key="chat_send"):
                     if user_input:
-                        st.session_state.chat_history.append({"role": "user", "content": user_input})
-                        response = chat_with_consultant(user_input, st.session_state.chat_history)
-                        st.session_state.chat_history.append({"role": "assistant", "content": response})
+                        message = {"role": "user", "content": user_input}
+                        # A duplicate click re-runs this branch while the first reply is in flight
+                        if st.session_state.chat_history[-1:] != [message]:
+                            st.session_state.chat_history.append(message)
+                        response = once("chat_inflight")(chat_with_consultant)(user_input, st.session_state.chat_history)
+                        reply = {"role": "assistant", "content": response}
+                        # The interrupted first run may already have appended the reply it handed over
+                        if st.session_state.chat_history[-1:] != [reply]:
+                            st.session_state.chat_history.append(reply)
                         st.rerun()
             
             with col2:
@@ -855,6 +1784,12 @@ def render_dashboard():
             logout_user()
             st.rerun()
     
+    with st.sidebar:
+        if st.button("🧹 Clear cache", help="Discard cached AI responses and logos"):
+            st.cache_data.clear()
+            semantic_cache_clear()
+            st.success("Cache cleared!")
+    
     st.markdown("---")
     
     # Main content tabs
@@ -884,6 +1819,11 @@ def render_dashboard():
     # Floating chat widget
     render_floating_chat()
 
+def refresh_full_story():
+    """Rebuild the joined story text after the story changes, so reruns never re-join it"""
+    story = st.session_state.brand_data.get('story', {})
+    st.session_state.brand_data['full_story'] = " ".join(v for v in story.values() if v)
+
 def render_brand_generation():
     """Render brand generation section"""
     
@@ -898,39 +1838,97 @@ def render_brand_generation():
     
     industry = st.text_input("Industry", placeholder="e.g., Technology, Fashion, Food")
     
-    col1, col2 = st.columns(2)
+    if st.button("🚀 Generate Brand Kit", type="primary", use_container_width=True):
+        if business_desc and industry:
+            with st.spinner("Generating your complete brand kit..."):
+                kit = once("gen_kit_inflight")(generate_brand_kit)(
+                    business_desc,
+                    industry,
+                    st.session_state.language,
+                    st.session_state.selected_palette_style,
+                    fresh=True
+                )
+            
+            st.session_state.brand_data.update({
+                **kit,
+                'business_desc': business_desc,
+                'industry': industry
+            })
+            refresh_full_story()
+            st.success("Brand kit generated!")
+            st.rerun()
+        else:
+            st.warning("Please provide business description and industry")
     
-    with col1:
-        if st.button("🎯 Generate Brand Names", use_container_width=True):
-            if business_desc and industry:
-                with st.spinner("Generating creative brand names..."):
-                    names = generate_brand_names(
-                        business_desc,
-                        industry,
-                        st.session_state.language,
-                        count=10
-                    )
+    with st.expander("Regenerate individual parts"):
+        batch_mode = st.toggle(
+            "Batch mode (cheaper, ~1min delay)",
+            help="Submit taglines, story, marketing and palette as one Groq batch job instead of live requests"
+        )
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            if st.button("🎯 Generate Brand Names", use_container_width=True):
+                if business_desc and industry:
+                    with st.spinner("Generating creative brand names..."):
+                        names = once("gen_names_inflight")(generate_brand_names)(
+                            business_desc,
+                            industry,
+                            st.session_state.language,
+                            count=10,
+                            fresh=True
+                        )
+                    
                     st.session_state.brand_data['names'] = names
+                    st.session_state.brand_data['business_desc'] = business_desc
+                    st.session_state.brand_data['industry'] = industry
                     st.success("Brand names generated!")
                     st.rerun()
-            else:
-                st.warning("Please provide business description and industry")
-    
-    with col2:
-        if st.button("💡 Generate Taglines", use_container_width=True):
-            if 'selected_name' in st.session_state.brand_data and business_desc:
-                with st.spinner("Creating taglines..."):
-                    taglines = generate_taglines(
-                        st.session_state.brand_data['selected_name'],
-                        business_desc,
-                        st.session_state.language,
-                        count=3
-                    )
+                else:
+                    st.warning("Please provide business description and industry")
+        
+        with col2:
+            # Only the taglines; story, marketing copy and palette edits are left alone
+            if st.button("✍️ Regenerate Taglines", use_container_width=True):
+                if 'selected_name' in st.session_state.brand_data and business_desc:
+                    with st.spinner("Writing taglines..."):
+                        taglines = once("gen_taglines_inflight")(generate_taglines)(
+                            st.session_state.brand_data['selected_name'],
+                            business_desc,
+                            st.session_state.language,
+                            fresh=True
+                        )
+                    
                     st.session_state.brand_data['taglines'] = taglines
                     st.success("Taglines generated!")
                     st.rerun()
-            else:
-                st.warning("Please select a brand name first")
+                else:
+                    st.warning("Please select a brand name and provide business description first")
+        
+        with col3:
+            if st.button("💡 Regenerate Taglines, Story & Palette", use_container_width=True):
+                if 'selected_name' in st.session_state.brand_data and business_desc and industry:
+                    with st.spinner("Creating taglines, story, marketing content and palette..."):
+                        generate = generate_brand_bundle_batch if batch_mode else generate_brand_bundle
+                        try:
+                            bundle = once("gen_bundle_inflight")(generate)(
+                                st.session_state.brand_data['selected_name'],
+                                business_desc,
+                                industry,
+                                st.session_state.language,
+                                st.session_state.selected_palette_style,
+                                fresh=True
+                            )
+                        except Exception as e:
+                            st.error(f"Brand kit generation failed: {str(e)}")
+                        else:
+                            st.session_state.brand_data.update(bundle)
+                            refresh_full_story()
+                            st.success("Taglines and brand kit generated!")
+                            st.rerun()
+                else:
+                    st.warning("Please select a brand name and provide business description and industry first")
     
     # Display generated names
     if 'names' in st.session_state.brand_data:
@@ -952,6 +1950,13 @@ def render_brand_generation():
             with col2:
                 if st.button("Select", key=f"select_name_{i}"):
                     st.session_state.brand_data['selected_name'] = name
+                    
+                    # Start the Brand Story tab's generations while the user reviews this one
+                    if business_desc and industry:
+                        language = st.session_state.language
+                        prefetch('story', generate_brand_story, name, business_desc, industry, language)
+                        prefetch('marketing', generate_marketing_content, name, business_desc, language)
+                    
                     st.success(f"Selected: {name}")
                     st.rerun()
     
@@ -967,6 +1972,80 @@ def render_brand_generation():
     
     st.markdown("</div>", unsafe_allow_html=True)
 
+@st.fragment(run_every=1)
+def _marketing_job_status():
+    """Poll the background marketing generation without blocking the rest of the tab"""
+    
+    args = st.session_state.marketing_job
+    entry = st.session_state.prefetch.get('marketing')
+    
+    if entry is not None and entry[0] == args and not entry[1].done():
+        st.status("Writing marketing content in the background...", state="running")
+        return
+    
+    st.session_state.marketing_job = None
+    content = take_prefetched('marketing', *args)
+    
+    if content and any(content.values()):
+        st.session_state.brand_data['marketing'] = content
+        st.toast("Marketing content generated!")
+    else:
+        st.toast("Marketing content generation failed, please try again")
+    st.rerun()
+
+@st.fragment
+def _story_editor():
+    """Story editor and sentiment metrics, rerun on their own when edits are applied"""
+    
+    story = st.session_state.brand_data['story']
+    
+    sections = [
+        ("🔭 Vision", "vision"),
+        ("🎯 Mission", "mission"),
+        ("⚠️ Problem", "problem"),
+        ("✅ Solution", "solution"),
+        ("🏆 Positioning", "positioning")
+    ]
+    
+    # Edits commit together on submit instead of rerunning per keystroke
+    with st.form("story_edit_form"):
+        edited = {}
+        for title, key in sections:
+            st.subheader(title)
+            edited[key] = st.text_area(
+                f"Edit {key}",
+                value=story.get(key, ""),
+                height=100,
+                key=f"story_{key}"
+            )
+        
+        if st.form_submit_button("Apply edits"):
+            st.session_state.brand_data['story'].update(edited)
+            refresh_full_story()
+    
+    # Sentiment Analysis
+    st.markdown("---")
+    st.subheader("📊 Sentiment Analysis")
+    
+    full_story = st.session_state.brand_data.get('full_story', "")
+    story_sentiment = sentiment(full_story)
+    
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Polarity", story_sentiment['polarity'])
+    col2.metric("Confidence", f"{story_sentiment['confidence']}%")
+    col3.metric("Tone", story_sentiment['tone'])
+    col4.metric("Alignment", story_sentiment['alignment'])
+    
+    if story_sentiment['polarity'] < 0:
+        if st.button("🔄 Rewrite for Positive Tone"):
+            with st.spinner("Rewriting..."):
+                rewritten = once("gen_rewrite_inflight")(rewrite_for_sentiment)(
+                    full_story, "positive", st.session_state.language
+                )
+            
+            st.write("**Rewritten Version:**")
+            st.write(rewritten)
+
 def render_brand_story():
     """Render brand story section"""
     
@@ -981,64 +2060,31 @@ def render_brand_story():
     col1, col2 = st.columns([3, 1])
     
     with col1:
-        business_desc = st.text_area("Business Description", height=100)
-        industry = st.text_input("Industry")
+        business_desc = st.text_area(
+            "Business Description",
+            value=st.session_state.brand_data.get('business_desc', ''),
+            height=100
+        )
+        industry = st.text_input("Industry", value=st.session_state.brand_data.get('industry', ''))
     
     with col2:
         if st.button("✨ Generate Story", use_container_width=True):
             if business_desc and industry:
-                with st.spinner("Crafting your brand story..."):
-                    story = generate_brand_story(
-                        st.session_state.brand_data['selected_name'],
-                        business_desc,
-                        industry,
-                        st.session_state.language
-                    )
-                    st.session_state.brand_data['story'] = story
-                    st.success("Brand story created!")
-                    st.rerun()
+                args = (st.session_state.brand_data['selected_name'], business_desc, industry, st.session_state.language)
+                story = take_prefetched('story', *args)
+                
+                if not story or not any(story.values()):
+                    lang_code, prompt = _brand_story_prompt(*args)
+                    story = _parse_brand_story(once("gen_story_inflight")(st.write_stream)(stream_groq_api(prompt, lang_code)))
+                
+                st.session_state.brand_data['story'] = story
+                refresh_full_story()
+                st.success("Brand story created!")
+                st.rerun()
     
     # Display story
     if 'story' in st.session_state.brand_data:
-        story = st.session_state.brand_data['story']
-        
-        sections = [
-            ("🔭 Vision", "vision"),
-            ("🎯 Mission", "mission"),
-            ("⚠️ Problem", "problem"),
-            ("✅ Solution", "solution"),
-            ("🏆 Positioning", "positioning")
-        ]
-        
-        for title, key in sections:
-            st.subheader(title)
-            edited_text = st.text_area(
-                f"Edit {key}",
-                value=story.get(key, ""),
-                height=100,
-                key=f"story_{key}"
-            )
-            st.session_state.brand_data['story'][key] = edited_text
-        
-        # Sentiment Analysis
-        st.markdown("---")
-        st.subheader("📊 Sentiment Analysis")
-        
-        full_story = " ".join(story.values())
-        sentiment = perform_sentiment_analysis(full_story)
-        
-        col1, col2, col3, col4 = st.columns(4)
-        col1.metric("Polarity", sentiment['polarity'])
-        col2.metric("Confidence", f"{sentiment['confidence']}%")
-        col3.metric("Tone", sentiment['tone'])
-        col4.metric("Alignment", sentiment['alignment'])
-        
-        if sentiment['polarity'] < 0:
-            if st.button("🔄 Rewrite for Positive Tone"):
-                with st.spinner("Rewriting..."):
-                    rewritten = rewrite_for_sentiment(full_story, "positive", st.session_state.language)
-                    st.write("**Rewritten Version:**")
-                    st.write(rewritten)
+        _story_editor()
     
     # Marketing Content
     st.markdown("---")
@@ -1046,15 +2092,17 @@ def render_brand_story():
     
     if st.button("Generate Marketing Content"):
         if 'selected_name' in st.session_state.brand_data and business_desc:
-            with st.spinner("Creating marketing content..."):
-                content = generate_marketing_content(
-                    st.session_state.brand_data['selected_name'],
-                    business_desc,
-                    st.session_state.language
-                )
-                st.session_state.brand_data['marketing'] = content
-                st.success("Marketing content generated!")
-                st.rerun()
+            args = (st.session_state.brand_data['selected_name'], business_desc, st.session_state.language)
+            
+            # Reuse the generation started on name selection when it matches and has started;
+            # a matching one still queued behind other prefetches moves to the foreground pool
+            entry = st.session_state.prefetch.get('marketing')
+            if entry is None or entry[0] != args or entry[1].cancel():
+                prefetch('marketing', generate_marketing_content, *args, pool=_foreground_pool())
+            st.session_state.marketing_job = args
+    
+    if st.session_state.marketing_job:
+        _marketing_job_status()
     
     if 'marketing' in st.session_state.brand_data:
         marketing = st.session_state.brand_data['marketing']
@@ -1076,6 +2124,37 @@ def render_brand_story():
     
     st.markdown("</div>", unsafe_allow_html=True)
 
+@st.fragment
+def _palette_editor():
+    """Palette preview and editor, rerun on their own when a color changes"""
+    
+    st.write("**Current Palette:**")
+    
+    # Filled after the editor so the preview reflects this run's edits
+    preview = st.empty()
+    
+    # Manual editing
+    st.write("**Edit Colors:**")
+    
+    if PALETTE_PICKER == "component":
+        st.session_state.brand_data['colors'] = palette_picker(
+            st.session_state.brand_data['colors'], key="palette_picker"
+        )
+    else:
+        cols = st.columns(5)
+        
+        for i, color in enumerate(st.session_state.brand_data['colors']):
+            with cols[i]:
+                new_color = st.color_picker(f"Color {i+1}", color, key=f"color_{i}")
+                st.session_state.brand_data['colors'][i] = new_color
+    
+    # Visual preview
+    color_html = ""
+    for color in st.session_state.brand_data['colors']:
+        color_html += f"<div class='color-box' style='background-color: {color};'></div>"
+    
+    preview.markdown(color_html, unsafe_allow_html=True)
+
 def render_visual_identity():
     """Render visual identity section"""
     
@@ -1090,8 +2169,8 @@ def render_visual_identity():
     with col1:
         palette_style = st.selectbox(
             "Palette Style",
-            list(COLOR_PALETTE_STYLES.keys()),
-            index=list(COLOR_PALETTE_STYLES.keys()).index(st.session_state.selected_palette_style)
+            list(PALETTE_STYLE_IDX),
+            index=PALETTE_STYLE_IDX[st.session_state.selected_palette_style]
         )
         st.session_state.selected_palette_style = palette_style
     
@@ -1100,34 +2179,20 @@ def render_visual_identity():
             if 'selected_name' in st.session_state.brand_data:
                 industry = st.text_input("Industry for palette", key="palette_industry") or "General"
                 with st.spinner("Creating color palette..."):
-                    colors = generate_color_palette(
+                    colors = once("gen_palette_inflight")(generate_color_palette)(
                         st.session_state.brand_data['selected_name'],
                         industry,
-                        palette_style
+                        palette_style,
+                        fresh=True
                     )
-                    st.session_state.brand_data['colors'] = colors
-                    st.success("Palette generated!")
-                    st.rerun()
+                
+                st.session_state.brand_data['colors'] = colors
+                st.success("Palette generated!")
+                st.rerun()
     
     # Display and edit colors
     if 'colors' in st.session_state.brand_data:
-        st.write("**Current Palette:**")
-        
-        # Visual preview
-        color_html = ""
-        for color in st.session_state.brand_data['colors']:
-            color_html += f"<div class='color-box' style='background-color: {color};'></div>"
-        
-        st.markdown(color_html, unsafe_allow_html=True)
-        
-        # Manual editing
-        st.write("**Edit Colors:**")
-        cols = st.columns(5)
-        
-        for i, color in enumerate(st.session_state.brand_data['colors']):
-            with cols[i]:
-                new_color = st.color_picker(f"Color {i+1}", color, key=f"color_{i}")
-                st.session_state.brand_data['colors'][i] = new_color
+        _palette_editor()
     
     st.markdown("---")
     
@@ -1137,13 +2202,13 @@ def render_visual_identity():
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        logo_font = st.selectbox("Logo Font", FONT_CATEGORIES["Logo Fonts"], key="logo_font_select")
+        logo_font = st.selectbox("Logo Font", LOGO_FONTS, key="logo_font_select")
     
     with col2:
-        heading_font = st.selectbox("Heading Font", FONT_CATEGORIES["Heading Fonts"], key="heading_font_select")
+        heading_font = st.selectbox("Heading Font", HEADING_FONTS, key="heading_font_select")
     
     with col3:
-        body_font = st.selectbox("Body Font", FONT_CATEGORIES["Body Fonts"], key="body_font_select")
+        body_font = st.selectbox("Body Font", BODY_FONTS, key="body_font_select")
     
     # Save font selections
     st.session_state.brand_data['fonts'] = {
@@ -1199,14 +2264,13 @@ def render_logo_studio():
         st.caption("**Combination**: Symbol + text")
     
     # Generation Options
-    col1, col2, col3 = st.columns(3)
+    col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         if st.button("🎨 Generate Logo", use_container_width=True):
             if industry:
                 # Get sentiment for mood
-                story_text = " ".join(st.session_state.brand_data.get('story', {}).values())
-                sentiment = perform_sentiment_analysis(story_text) if story_text else {"tone": "Neutral"}
+                story_sentiment = sentiment(st.session_state.brand_data.get('full_story', ""))
                 
                 # Get colors
                 colors = st.session_state.brand_data.get('colors', ["#A8D5E2", "#FFD6E8", "#C5E1F5"])
@@ -1217,11 +2281,11 @@ def render_logo_studio():
                     industry,
                     colors,
                     logo_type,
-                    sentiment['tone']
+                    story_sentiment['tone']
                 )
                 
                 with st.spinner("Generating logo... This may take a minute."):
-                    logo_image = generate_logo_sdxl(prompt)
+                    logo_image = once("gen_logo_inflight")(generate_logo_sdxl)(prompt)
                     
                     if logo_image:
                         st.session_state.brand_data['logo'] = logo_image
@@ -1237,7 +2301,7 @@ def render_logo_studio():
                 with st.spinner("Regenerating with variation..."):
                     # Use different seed for variation
                     import random
-                    logo_image = generate_logo_sdxl(
+                    logo_image = once("gen_logo_inflight")(generate_logo_sdxl)(
                         st.session_state.brand_data['logo_prompt'],
                         seed=random.randint(1, 1000000)
                     )
@@ -1248,10 +2312,39 @@ def render_logo_studio():
                         st.rerun()
     
     with col3:
+        if st.button("🎲 Variations", use_container_width=True):
+            if 'logo_prompt' in st.session_state.brand_data:
+                with st.spinner(f"Generating {LOGO_VARIATION_COUNT} variations..."):
+                    import random
+                    prompt = st.session_state.brand_data['logo_prompt']
+                    variants = once("gen_variants_inflight")(generate_logo_variants)(
+                        [(prompt, random.randint(1, 1000000)) for _ in range(LOGO_VARIATION_COUNT)]
+                    )
+                
+                st.session_state.logo_variants = variants
+                st.rerun()
+            else:
+                st.warning("Please generate a logo first")
+    
+    with col4:
         if st.button("⚙️ Customize", use_container_width=True):
             st.session_state.logo_customization_mode = not st.session_state.logo_customization_mode
             st.rerun()
     
+    # Variations
+    if st.session_state.logo_variants:
+        st.subheader("Variations")
+        
+        cols = st.columns(2)
+        for i, variant in enumerate(st.session_state.logo_variants):
+            with cols[i % 2]:
+                st.image(variant, use_container_width=True)
+                if st.button("Pick this one", key=f"pick_variant_{i}"):
+                    st.session_state.brand_data['logo'] = variant
+                    st.session_state.logo_variants = []
+                    st.success("Logo updated!")
+                    st.rerun()
+    
     # Display Logo
     if 'logo' in st.session_state.brand_data:
         st.markdown("<div class='logo-container'>", unsafe_allow_html=True)
@@ -1280,7 +2373,7 @@ def render_logo_studio():
                 custom_prompt += f", {icon_style.lower()} style, {layout.lower()} layout"
                 
                 with st.spinner("Applying customization..."):
-                    logo_image = generate_logo_sdxl(custom_prompt)
+                    logo_image = once("gen_logo_inflight")(generate_logo_sdxl)(custom_prompt)
                     
                     if logo_image:
                         st.session_state.brand_data['logo'] = logo_image
@@ -1295,11 +2388,9 @@ def render_logo_studio():
         
         with col1:
             # PNG Download
-            buf = BytesIO()
-            st.session_state.brand_data['logo'].save(buf, format="PNG")
             st.download_button(
                 label="Download PNG",
-                data=buf.getvalue(),
+                data=st.session_state.brand_data['logo'],
                 file_name=f"{st.session_state.brand_data['selected_name']}_logo.png",
                 mime="image/png"
             )
@@ -1333,11 +2424,9 @@ def render_export_options():
             export_data['exported_at'] = datetime.now().isoformat()
             export_data['user'] = st.session_state.user_email
             
-            json_str = json.dumps(export_data, indent=2, ensure_ascii=False)
-            
             st.download_button(
                 label="Download JSON",
-                data=json_str,
+                data=orjson.dumps(export_data, option=orjson.OPT_INDENT_2),
                 file_name=f"{st.session_state.brand_data.get('selected_name', 'brand')}_data.json",
                 mime="application/json"
             )
@@ -1382,69 +2471,11 @@ Email Copy: {marketing.get('email_copy', '')}
     if st.button("📑 Generate PDF Brand Kit", use_container_width=True):
         with st.spinner("Creating PDF..."):
             try:
-                pdf = FPDF()
-                pdf.add_page()
-                pdf.set_font("Arial", "B", 24)
-                
-                # Title
                 brand_name = st.session_state.brand_data.get('selected_name', 'Brand Kit')
-                pdf.cell(0, 10, brand_name, ln=True, align="C")
-                
-                pdf.set_font("Arial", "", 12)
-                pdf.ln(10)
-                
-                # Taglines
-                pdf.set_font("Arial", "B", 16)
-                pdf.cell(0, 10, "Taglines", ln=True)
-                pdf.set_font("Arial", "", 12)
-                
-                for tagline in st.session_state.brand_data.get('taglines', []):
-                    pdf.multi_cell(0, 10, f"- {tagline}")
-                
-                pdf.ln(5)
-                
-                # Story sections
-                story = st.session_state.brand_data.get('story', {})
-                sections = [
-                    ("Vision", story.get('vision', '')),
-                    ("Mission", story.get('mission', '')),
-                    ("Problem", story.get('problem', '')),
-                    ("Solution", story.get('solution', '')),
-                    ("Positioning", story.get('positioning', ''))
-                ]
-                
-                for title, content in sections:
-                    if content:
-                        pdf.set_font("Arial", "B", 14)
-                        pdf.cell(0, 10, title, ln=True)
-                        pdf.set_font("Arial", "", 11)
-                        pdf.multi_cell(0, 8, content)
-                        pdf.ln(3)
-                
-                # Colors
-                if 'colors' in st.session_state.brand_data:
-                    pdf.set_font("Arial", "B", 14)
-                    pdf.cell(0, 10, "Color Palette", ln=True)
-                    pdf.set_font("Arial", "", 11)
-                    
-                    for color in st.session_state.brand_data['colors']:
-                        pdf.cell(0, 8, color, ln=True)
-                    
-                    pdf.ln(5)
-                
-                # Fonts
-                if 'fonts' in st.session_state.brand_data:
-                    pdf.set_font("Arial", "B", 14)
-                    pdf.cell(0, 10, "Typography", ln=True)
-                    pdf.set_font("Arial", "", 11)
-                    
-                    fonts = st.session_state.brand_data['fonts']
-                    pdf.cell(0, 8, f"Logo Font: {fonts.get('logo', 'N/A')}", ln=True)
-                    pdf.cell(0, 8, f"Heading Font: {fonts.get('heading', 'N/A')}", ln=True)
-                    pdf.cell(0, 8, f"Body Font: {fonts.get('body', 'N/A')}", ln=True)
-                
-                # Save PDF
-                pdf_output = pdf.output(dest='S').encode('latin-1')
+                pdf_output = build_brand_kit_pdf(
+                    {k: v for k, v in st.session_state.brand_data.items() if k != 'logo'},
+                    st.session_state.language
+                )
                 
                 st.download_button(
                     label="Download PDF Brand Kit",
@@ -1466,8 +2497,6 @@ Email Copy: {marketing.get('email_copy', '')}
     
     if st.button("Save Project"):
         if project_name:
-            projects = load_json_file(PROJECTS_FILE)
-            
             project_id = f"{st.session_state.user_email}_{project_name}_{datetime.now().timestamp()}"
             
             # Prepare project data
@@ -1475,16 +2504,7 @@ Email Copy: {marketing.get('email_copy', '')}
             project_data['project_name'] = project_name
             project_data['saved_at'] = datetime.now().isoformat()
             
-            projects[project_id] = project_data
-            save_json_file(PROJECTS_FILE, projects)
-            
-            # Update user's project list
-            users = load_json_file(USERS_FILE)
-            if st.session_state.user_email in users:
-                if 'projects' not in users[st.session_state.user_email]:
-                    users[st.session_state.user_email]['projects'] = []
-                users[st.session_state.user_email]['projects'].append(project_id)
-                save_json_file(USERS_FILE, users)
+            db.save_project(_project_db(), project_id, st.session_state.user_email, project_name, project_data)
             
             st.success(f"Project '{project_name}' saved successfully!")
         else:
@@ -1508,6 +2528,9 @@ def main():
     # Initialize session state
     init_session_state()
     
+    # Start loading the local logo model before anyone asks for a logo
+    warm_local_sdxl()
+    
     # Apply custom CSS
     apply_custom_css()
     
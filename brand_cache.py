@@ -0,0 +1,195 @@
+"""
+BrandForge AI - Semantic response cache
+Serves stored LLM responses for near-duplicate generator inputs
+"""
+
+import atexit
+import hashlib
+import os
+import threading
+import time
+from typing import List, Optional
+
+import orjson
+
+# Defaults
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+SIMILARITY_THRESHOLD = 0.92
+MAX_AGE_SECONDS = 7 * 24 * 60 * 60
+INDEX_FILENAME = "brand_cache.faiss"
+PAYLOADS_FILENAME = "brand_cache.json"
+EMBEDDINGS_DIRNAME = os.path.join(".cache", "emb")
+
+# Neighbours probed per lookup; hits must also match the namespace exactly
+SEARCH_K = 4
+
+# Persist after this many inserts or this many seconds, whichever comes first
+SAVE_EVERY = 16
+SAVE_INTERVAL_SECONDS = 30
+
+
+class SemanticCache:
+    """FAISS inner-product index over normalized MiniLM embeddings with a parallel payload list"""
+
+    def __init__(self, directory: str, model_name: str = EMBEDDING_MODEL,
+                 threshold: float = SIMILARITY_THRESHOLD, max_age: float = MAX_AGE_SECONDS):
+        self.index_path = os.path.join(directory, INDEX_FILENAME)
+        self.payloads_path = os.path.join(directory, PAYLOADS_FILENAME)
+        self.model_name = model_name
+        self.threshold = threshold
+        self.max_age = max_age
+
+        self.embeddings_path = os.path.join(directory, EMBEDDINGS_DIRNAME)
+
+        # _lock guards the index and entries, _init_lock the lazily loaded model and
+        # embedding store, _save_lock keeps snapshots reaching disk in order
+        self._lock = threading.Lock()
+        self._init_lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._model = None
+        self._embeddings = None
+        self._index = None
+        self._entries: List[dict] = []
+        self._unsaved = 0
+        self._saved_at = time.time()
+        self._load()
+        atexit.register(self.flush)
+
+    def _load(self):
+        """Restore the index and payloads persisted by a previous process"""
+        import faiss
+
+        if os.path.exists(self.index_path) and os.path.exists(self.payloads_path):
+            with open(self.payloads_path, 'rb') as f:
+                entries = orjson.loads(f.read())
+            index = faiss.read_index(self.index_path)
+
+            # Discard a torn pair rather than serve misaligned payloads
+            if index.ntotal == len(entries):
+                self._index = index
+                self._entries = entries
+                self._prune()
+
+    def _remove(self, ids: List[int]):
+        """Drop the given entries from the index and payloads; caller holds _lock"""
+        import numpy as np
+
+        if not ids:
+            return
+
+        # Flat indexes compact on removal, so surviving ids stay aligned with the entries list
+        self._index.remove_ids(np.array(ids, dtype="int64"))
+        removed = set(ids)
+        self._entries = [entry for i, entry in enumerate(self._entries) if i not in removed]
+        self._unsaved += len(ids)
+
+    def _prune(self):
+        """Drop entries older than max_age; caller holds _lock"""
+        cutoff = time.time() - self.max_age
+        self._remove([i for i, entry in enumerate(self._entries) if entry["timestamp"] < cutoff])
+
+    def flush(self):
+        """Persist pending inserts atomically
+
+        The snapshot is taken under _lock but written outside it, so lookups are
+        never blocked on disk I/O.
+        """
+        import faiss
+
+        with self._save_lock:
+            with self._lock:
+                if not self._unsaved or self._index is None:
+                    return
+                self._prune()
+                index_bytes = faiss.serialize_index(self._index).tobytes()
+                payloads = orjson.dumps(self._entries)
+                self._unsaved = 0
+                self._saved_at = time.time()
+
+            with open(self.index_path + ".tmp", 'wb') as f:
+                f.write(index_bytes)
+            with open(self.payloads_path + ".tmp", 'wb') as f:
+                f.write(payloads)
+
+            os.replace(self.index_path + ".tmp", self.index_path)
+            os.replace(self.payloads_path + ".tmp", self.payloads_path)
+
+    def clear(self):
+        """Drop every cached payload, in memory and on disk"""
+        with self._save_lock, self._lock:
+            self._index = None
+            self._entries = []
+            self._unsaved = 0
+            for path in (self.index_path, self.payloads_path):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def embed(self, text: str):
+        """Embed text as a normalized float32 row vector, reusing vectors persisted on disk"""
+        if self._embeddings is None:
+            with self._init_lock:
+                if self._embeddings is None:
+                    from diskcache import Cache
+                    self._embeddings = Cache(self.embeddings_path)
+
+        # Keyed by model as well as text so a model change never serves stale vectors
+        key = hashlib.blake2b(f"{self.model_name}\0{text}".encode("utf-8"), digest_size=16).hexdigest()
+        vector = self._embeddings.get(key)
+        if vector is not None:
+            return vector
+
+        # Concurrent first lookups must not each load their own copy of the model
+        if self._model is None:
+            with self._init_lock:
+                if self._model is None:
+                    from sentence_transformers import SentenceTransformer
+                    self._model = SentenceTransformer(self.model_name)
+
+        vector = self._model.encode([text], normalize_embeddings=True).astype("float32")
+        self._embeddings.set(key, vector)
+        return vector
+
+    def lookup(self, namespace: str, text: str) -> Optional[str]:
+        """Return the cached payload for a near-duplicate input in the same namespace, if any"""
+        vector = self.embed(f"{namespace}|{text}")
+
+        with self._lock:
+            if self._index is None or self._index.ntotal == 0:
+                return None
+
+            scores, ids = self._index.search(vector, min(SEARCH_K, self._index.ntotal))
+            now = time.time()
+
+            for score, i in zip(scores[0], ids[0]):
+                if score <= self.threshold:
+                    break
+                entry = self._entries[i]
+                if entry["namespace"] == namespace and now - entry["timestamp"] <= self.max_age:
+                    return entry["payload"]
+
+        return None
+
+    def store(self, namespace: str, text: str, payload: str):
+        """Add a payload to the cache, persisting once enough inserts or time have accumulated
+
+        Near-duplicates already stored in the namespace are replaced, so a regenerated
+        response is what later lookups return.
+        """
+        import faiss
+
+        vector = self.embed(f"{namespace}|{text}")
+
+        with self._lock:
+            if self._index is None:
+                self._index = faiss.IndexFlatIP(vector.shape[1])
+            else:
+                _, _, ids = self._index.range_search(vector, self.threshold)
+                self._remove([int(i) for i in ids if self._entries[i]["namespace"] == namespace])
+
+            self._index.add(vector)
+            self._entries.append({"namespace": namespace, "payload": payload, "timestamp": time.time()})
+            self._unsaved += 1
+            due = self._unsaved >= SAVE_EVERY or time.time() - self._saved_at >= SAVE_INTERVAL_SECONDS
+
+        if due:
+            self.flush()
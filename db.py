@@ -0,0 +1,36 @@
+"""
+BrandForge AI - Project store
+SQLite persistence for saved brand projects
+"""
+
+import json
+import sqlite3
+import time
+from typing import Dict
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    id TEXT PRIMARY KEY,
+    user TEXT NOT NULL,
+    name TEXT NOT NULL,
+    data JSON NOT NULL,
+    saved_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS projects_user ON projects (user, saved_at);
+"""
+
+
+def connect(path: str) -> sqlite3.Connection:
+    """Open the project database in autocommit WAL mode, creating the schema if needed"""
+    conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def save_project(conn: sqlite3.Connection, project_id: str, user: str, name: str, data: Dict):
+    """Insert or replace a single project row"""
+    conn.execute(
+        "INSERT OR REPLACE INTO projects VALUES (?, ?, ?, ?, ?)",
+        (project_id, user, name, json.dumps(data, ensure_ascii=False), time.time())
+    )